@@ -9,21 +9,16 @@ from datetime import datetime, timezone
 
 author = "tadams42"
 project = "seveno-pyutil"
-copyright = (
-    ", ".join(str(y) for y in range(2017, datetime.now(tz=timezone.utc).year + 1))
-    + ", "
-    + author
-)
+copyright = f"2017-{datetime.now(tz=timezone.utc).year}, {author}"
 release = "0.9.0"
 
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.intersphinx",
     "sphinx.ext.napoleon",
-    "sphinx.ext.autosummary",
     "myst_parser",
     "sphinx_copybutton",
 ]
@@ -49,6 +44,14 @@ intersphinx_mapping = {
 
 add_module_names = False
 
+# AutoAPI settings
+# API docs are generated by parsing sources instead of importing them. Pages are not
+# generated automatically, api.rst places them via autoapi* directives.
+autoapi_dirs = ["../src"]
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+autoapi_keep_files = False
+
 
 # Napoleon settings
 napoleon_google_docstring = True
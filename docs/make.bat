@@ -7,6 +7,9 @@ REM Command file for Sphinx documentation
 if "%SPHINXBUILD%" == "" (
 	set SPHINXBUILD=python -msphinx
 )
+if "%SPHINXOPTS%" == "" (
+	set SPHINXOPTS=-j auto
+)
 set SOURCEDIR=.
 set BUILDDIR=_build
 set SPHINXPROJ=seveno_pyutil
@@ -1,28 +1,100 @@
 __version__ = "0.9.0"
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
-from .benchmarking_utilities import Stopwatch
-from .collections_utilities import in_batches
-from .datetime_utilities import ensure_tzinfo, iter_year_month
-from .error_utilities import ExceptionsAsErrors, add_error_to
-from .file_utilities import abspath_if_relative, file_checksum, move_and_create_dest
-from .logging_utilities import (
-    FlaskSQLStats,
-    PrettyFormatter,
-    SQLFilter,
-    StandardMetadataFilter,
-    log_to_console_for,
-    log_to_tmp_file_for,
-    silence_logger,
-)
-from .metaprogramming_helpers import (
-    all_subclasses,
-    getval,
-    import_string,
-    leaf_subclasses,
-)
-from .os_utilities import current_user, current_user_home
-from .string_utilities import is_blank
-
-logging.getLogger(__name__).addHandler(logging.NullHandler())
+if TYPE_CHECKING:
+    from .benchmarking_utilities import Stopwatch
+    from .collections_utilities import in_batches, in_batches_list, inverted
+    from .datetime_utilities import ensure_tzinfo, iter_year_month
+    from .error_utilities import ExceptionsAsErrors, add_error_to
+    from .file_utilities import (
+        abspath_if_relative,
+        file_checksum,
+        file_checksums,
+        move_and_create_dest,
+    )
+    from .logging_utilities import (
+        FlaskSQLStats,
+        PrettyFormatter,
+        SQLFilter,
+        StandardMetadataFilter,
+        install_async_handler,
+        install_buffered_handler,
+        log_to_console_for,
+        log_to_tmp_file_for,
+        silence_logger,
+    )
+    from .metaprogramming_helpers import (
+        all_subclasses,
+        getval,
+        import_string,
+        leaf_subclasses,
+    )
+    from .os_utilities import current_user, current_user_home
+    from .string_utilities import is_blank
+
+# Public names mapped to submodules that define them. Submodules are imported on first
+# attribute access (PEP 562) so that ie. ``from seveno_pyutil import is_blank`` doesn't
+# pay for importing colorlog, pygments, sqlparse, holidays, ...
+_LAZY = {
+    "Stopwatch": "benchmarking_utilities",
+    "in_batches": "collections_utilities",
+    "in_batches_list": "collections_utilities",
+    "inverted": "collections_utilities",
+    "ensure_tzinfo": "datetime_utilities",
+    "iter_year_month": "datetime_utilities",
+    "ExceptionsAsErrors": "error_utilities",
+    "add_error_to": "error_utilities",
+    "abspath_if_relative": "file_utilities",
+    "file_checksum": "file_utilities",
+    "file_checksums": "file_utilities",
+    "move_and_create_dest": "file_utilities",
+    "FlaskSQLStats": "logging_utilities",
+    "PrettyFormatter": "logging_utilities",
+    "SQLFilter": "logging_utilities",
+    "StandardMetadataFilter": "logging_utilities",
+    "install_async_handler": "logging_utilities",
+    "install_buffered_handler": "logging_utilities",
+    "log_to_console_for": "logging_utilities",
+    "log_to_tmp_file_for": "logging_utilities",
+    "silence_logger": "logging_utilities",
+    "all_subclasses": "metaprogramming_helpers",
+    "getval": "metaprogramming_helpers",
+    "import_string": "metaprogramming_helpers",
+    "leaf_subclasses": "metaprogramming_helpers",
+    "current_user": "os_utilities",
+    "current_user_home": "os_utilities",
+    "is_blank": "string_utilities",
+}
+
+__all__ = list(_LAZY)
+
+# Submodules themselves are also reachable as package attributes (ie.
+# ``seveno_pyutil.datetime_utilities``) after plain ``import seveno_pyutil``.
+_SUBMODULES = frozenset(_LAZY.values())
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        # import_module() also binds submodule in package namespace
+        return importlib.import_module(f".{name}", __name__)
+
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    val = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = val
+    return val
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
+
+
+# Guarded so that importlib.reload() doesn't stack up NullHandlers
+if not logging.getLogger(__name__).handlers:
+    logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,4 +1,4 @@
-import timeit
+import time
 
 
 class Stopwatch:
@@ -13,18 +13,24 @@ class Stopwatch:
         >>> assert stopwatch.duration_ms >= 1000
     """
 
+    __slots__ = ("end", "start")
+
     def __init__(self):
         self.start = 0
         self.end = 0
 
     def __enter__(self):
-        self.start = timeit.default_timer()
+        self.start = time.perf_counter_ns()
         return self
 
     def __exit__(self, *args):
-        self.end = timeit.default_timer()
+        self.end = time.perf_counter_ns()
         return False
 
+    @property
+    def duration_ns(self) -> int:
+        return self.end - self.start
+
     @property
     def duration_ms(self):
-        return (self.end - self.start) * 1000
+        return (self.end - self.start) / 1_000_000
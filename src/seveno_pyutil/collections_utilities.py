@@ -1,5 +1,5 @@
 import itertools
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 
@@ -45,3 +45,64 @@ def in_batches(iterable: Iterable[Any], of_size: int = 1):
         except StopIteration:
             return
         yield itertools.chain((first_el,), chunk_it)
+
+
+def in_batches_list(iterable: Iterable[Any], of_size: int = 1) -> Iterator[Any]:
+    """
+    Returns generator that yields batches of iterable as ready-made lists (or
+    slices).
+
+    Unlike `in_batches`, batches are independent of each other so they don't need to
+    be consumed before next one is requested. For `collections.abc.Sequence` and
+    array-like (ie. ``numpy.ndarray``) inputs batches are slices of original object
+    (for arrays these are views, no data is copied), otherwise they are `list`
+    objects.
+
+    Example::
+
+        from seveno_pyutil import in_batches_list
+
+        g = (o for o in range(10))
+        for batch in in_batches_list(g, of_size=3):
+            print(batch)
+        # [0, 1, 2]
+        # [3, 4, 5]
+        # [6, 7, 8]
+        # [9]
+
+        for batch in in_batches_list("abcdefg", of_size=3):
+            print(batch)
+        # abc
+        # def
+        # g
+
+    Raises:
+        ValueError: if ``of_size`` is less than 1
+    """
+    # Validated here, when called, and not lazily on first batch
+    if of_size < 1:
+        raise ValueError(f"Batch size must be at least 1, got: {of_size}")
+
+    return _in_batches_list(iterable, of_size)
+
+
+def _in_batches_list(iterable: Iterable[Any], of_size: int) -> Iterator[Any]:
+    if isinstance(iterable, Sequence) or hasattr(iterable, "__array__"):
+        for i in range(0, len(iterable), of_size):
+            yield iterable[i : i + of_size]
+        return
+
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, of_size)):
+        yield chunk
+
+
+def inverted(dct: Mapping) -> dict:
+    """
+    Returns new dict with keys and values of ``dct`` swapped.
+
+    Example:
+        >>> inverted({"a": 1, "b": 2})
+        {1: 'a', 2: 'b'}
+    """
+    return dict(zip(dct.values(), dct.keys(), strict=True))
@@ -1,5 +1,7 @@
 import contextlib
+import functools
 import re
+import time
 from datetime import date, datetime, timedelta, timezone, tzinfo
 from typing import TypeAlias
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -8,20 +10,126 @@ import holidays
 
 TimeZoneLike: TypeAlias = str | int | timedelta | tzinfo | ZoneInfo | timezone
 
-CROATIAN_HOLIDAYS = holidays.HR()
 _ONE_DAY = timedelta(days=1)
+_SECONDS_PER_DAY = 86400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_UTC = ZoneInfo("UTC")
+_UTC_ALIASES = frozenset(("UTC", "Z", ""))
 _ISO_8601_OFFSET = re.compile(r"([+-]?)([0-9]{2})[:]?([0-9]{0,2})")
+_ISO_8601_OFFSET_MATCH = _ISO_8601_OFFSET.match
+_EPOCH_YEAR_MONTH_INDEX = 1970 * 12
 
 
-def next_working_day(from_: date | None = None, holidays_calendar=CROATIAN_HOLIDAYS):
-    """Finds next work day from `from_` or today."""
-    next_day = (from_ or datetime.now(tz=timezone.utc).date()) + _ONE_DAY
+@functools.cache
+def _croatian_holidays() -> holidays.HolidayBase:
+    return holidays.HR()
+
+
+def __getattr__(name: str):
+    # CROATIAN_HOLIDAYS is created on first access, holidays.HR() is expensive to
+    # instantiate.
+    if name == "CROATIAN_HOLIDAYS":
+        return _croatian_holidays()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _today_utc() -> date:
+    """Same as ``datetime.now(tz=timezone.utc).date()`` without building datetime."""
+    return date.fromordinal(_EPOCH_ORDINAL + int(time.time() // _SECONDS_PER_DAY))
+
+
+def next_working_day(from_: date | None = None, holidays_calendar=None):
+    """
+    Finds next work day from `from_` or today.
+
+    ``holidays_calendar`` defaults to `holidays.HR`.
+    """
+    if holidays_calendar is None:
+        holidays_calendar = _croatian_holidays()
+
+    next_day = (from_ or _today_utc()) + _ONE_DAY
     while next_day.weekday() in holidays.WEEKEND or next_day in holidays_calendar:
         next_day += _ONE_DAY
     return next_day
 
 
-def timezone_or_offset(from_: TimeZoneLike | None) -> ZoneInfo | timezone:  # noqa: C901
+def _parse_iso_offset(from_: str) -> timezone | None:
+    """
+    Parses ``[+-]HH``, ``[+-]HHMM`` and ``[+-]HH:MM`` offsets without regex.
+
+    Returns `None` if ``from_`` is not in one of these forms.
+    """
+    sign = -1 if from_[0] == "-" else 1
+    digits = from_[1:] if from_[0] in "+-" else from_
+    if len(digits) == 5 and digits[2] == ":":  # noqa: PLR2004
+        digits = digits[:2] + digits[3:]
+
+    if len(digits) not in (2, 4) or not (digits.isascii() and digits.isdigit()):
+        return None
+
+    return timezone(
+        name=from_,
+        offset=sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:] or 0)),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _timezone_from_str(from_: str) -> ZoneInfo | timezone | None:
+    """
+    Parses timezone name or ISO8601 offset string.
+
+    Memoized because for timezone names, `zoneinfo.ZoneInfo` lookup may hit the
+    filesystem.
+    """
+    if from_.strip() in ("Z", ""):
+        return _UTC
+
+    offset_obj = None
+
+    if from_[0] in "+-" or from_[0].isdigit():
+        # Offsets are never valid timezone names; don't even try ZoneInfo for them
+        offset_obj = _parse_iso_offset(from_)
+    else:
+        with contextlib.suppress(ZoneInfoNotFoundError, ValueError):
+            offset_obj = ZoneInfo(from_)
+
+    if not offset_obj:
+        match_object = _ISO_8601_OFFSET_MATCH(from_)
+        if match_object:
+            sign, hours, minutes = match_object.group(1, 2, 3)
+            offset_obj = timezone(
+                name=from_,
+                offset=(-1 if sign == "-" else 1)
+                * timedelta(hours=int(hours), minutes=int(minutes or 0)),
+            )
+
+    return offset_obj
+
+
+@functools.lru_cache(maxsize=256)
+def _timezone_from_timedelta(from_: timedelta) -> timezone:
+    return timezone(name=f"{from_.total_seconds()} s", offset=from_)
+
+
+@functools.lru_cache(maxsize=256)
+def _timezone_from_seconds(from_: int) -> timezone:
+    return timezone(name=f"{from_} s", offset=timedelta(seconds=from_))
+
+
+def _identity(from_):
+    return from_
+
+
+_TIMEZONE_PARSERS = {
+    str: _timezone_from_str,
+    int: _timezone_from_seconds,
+    timedelta: _timezone_from_timedelta,
+    ZoneInfo: _identity,
+    timezone: _identity,
+}
+
+
+def timezone_or_offset(from_: TimeZoneLike | None) -> ZoneInfo | timezone:
     """
     Given ``from_`` creates `datetime.timezone` or `zoneinfo.ZoneInfo` as
     result.
@@ -33,39 +141,34 @@ def timezone_or_offset(from_: TimeZoneLike | None) -> ZoneInfo | timezone:  # no
     - `int` (ie. -9000) which is total number of seconds in time offset
     - `datetime.timedelta`
     - `datetime.tzinfo` or something that behaves like it
-    """
-    offset_obj = None
-
-    if from_ is None:
-        offset_obj = ZoneInfo("UTC")
 
-    elif isinstance(from_, ZoneInfo | timezone):
+    Results for `str`, `int` and `datetime.timedelta` inputs are memoized, so
+    repeated calls with the same value return the same object.
+    """
+    if from_ is None or (type(from_) is str and from_ in _UTC_ALIASES):
+        return _UTC
+
+    # Fast path: exact type lookup instead of walking isinstance() chain below
+    handler = _TIMEZONE_PARSERS.get(type(from_))
+    if handler is not None:
+        offset_obj = handler(from_)
+        if offset_obj is None:
+            raise ValueError(f"Unable to parse time offset: {from_}")
+        return offset_obj
+
+    if isinstance(from_, ZoneInfo | timezone):
         return from_
 
-    elif isinstance(from_, str):
-        with contextlib.suppress(ZoneInfoNotFoundError, ValueError):
-            offset_obj = ZoneInfo(from_)
+    offset_obj = None
 
-        if not offset_obj:
-            if from_.strip() in ["Z", ""]:
-                offset_obj = ZoneInfo("UTC")
-            else:
-                match_object = _ISO_8601_OFFSET.match(from_)
-                if match_object:
-                    sign, hours, minutes = match_object.groups()
-                    offset_obj = timezone(
-                        name=from_,
-                        offset=timedelta(
-                            hours=(-1 if sign == "-" else 1) * int(hours),
-                            minutes=int(minutes or 0),
-                        ),
-                    )
+    if isinstance(from_, str):
+        offset_obj = _timezone_from_str(from_)
 
     elif isinstance(from_, timedelta):
-        offset_obj = timezone(name=f"{from_.total_seconds()} s", offset=from_)
+        offset_obj = _timezone_from_timedelta(from_)
 
     elif isinstance(from_, int):
-        offset_obj = timezone(name=f"{from_} s", offset=timedelta(seconds=from_))
+        offset_obj = _timezone_from_seconds(from_)
 
     elif issubclass(type(from_), tzinfo) or all(
         hasattr(from_, attr_name)
@@ -80,7 +183,7 @@ def timezone_or_offset(from_: TimeZoneLike | None) -> ZoneInfo | timezone:  # no
 
 
 def ensure_tzinfo(
-    val: datetime, tz_or_offset: TimeZoneLike = "UTC", *, is_dst: bool = False
+    val: datetime, tz_or_offset: TimeZoneLike = _UTC, *, is_dst: bool = False
 ) -> datetime:
     """
     Creates timezone aware datetime object for ``val``.
@@ -117,17 +220,46 @@ def ensure_tzinfo(
             "need to do that beforehand."
         )
 
+    # Already in requested timezone, no need to even parse ``tz_or_offset``
+    if tz_or_offset is not None and val.tzinfo is tz_or_offset:
+        return val
+
     tz_or_offset = timezone_or_offset(tz_or_offset)
 
+    if val.tzinfo is tz_or_offset:
+        return val
+
     if not val.tzinfo:
-        val = val.replace(tzinfo=tz_or_offset)
-    else:
-        val = val.astimezone(tz_or_offset)
+        return val.replace(tzinfo=tz_or_offset)
+
+    return val.astimezone(tz_or_offset)
+
+
+def _year_month_indexes(
+    start: date | datetime,
+    end: date | None,
+    *,
+    include_start: bool,
+    include_end: bool,
+) -> range:
+    """Range of ``year * 12 + month - 1`` month indexes for `iter_year_month`."""
+    if not end:
+        end = start
+
+    first = start.year * 12 + start.month - 1
+    last = end.year * 12 + end.month - 1
+
+    if first == last:
+        if include_start or include_end:
+            return range(first, first + 1)
+        return range(0)
 
-    return val
+    return range(
+        first if include_start else first + 1, last + 1 if include_end else last
+    )
 
 
-def iter_year_month(  # noqa: C901
+def iter_year_month(
     start: date | datetime,
     end: date | None = None,
     *,
@@ -147,39 +279,40 @@ def iter_year_month(  # noqa: C901
         include_start: include ``start`` in generated range
         include_end: include ``end`` in generated range
     """
+    for idx in _year_month_indexes(
+        start, end, include_start=include_start, include_end=include_end
+    ):
+        year, month = divmod(idx, 12)
+        yield date(year=year, month=month + 1, day=1)
 
-    if not end:
-        end = start
-
-    start = date(year=start.year, month=start.month, day=1)
-    end = date(year=end.year, month=end.month, day=1)
-
-    if start > end:
-        return
-
-    if start == end:
-        if include_start or include_end:
-            yield start
-        return
-
-    val = date(year=start.year, month=start.month, day=1)
-
-    if include_start:
-        yield val
-
-    end_reached = False
-    while not end_reached:
-        try:
-            val = val.replace(month=val.month + 1)
 
-        except ValueError:
-            if val.month == 12:  # noqa: PLR2004
-                val = val.replace(year=val.year + 1, month=1)
+def iter_year_month_numpy(
+    start: date | datetime,
+    end: date | None = None,
+    *,
+    include_start: bool = False,
+    include_end: bool = False,
+):
+    """
+    Same range as `iter_year_month` but returned as ``numpy.ndarray`` of
+    ``datetime64[M]``.
 
-        if val == end:
-            if include_end:
-                yield val
-            end_reached = True
+    Whole range is built by single ``numpy.arange`` call, which is much faster than
+    creating `datetime.date` object per month when ranges are long and are going to
+    end up in arrays / dataframes anyway.
 
-        else:
-            yield val
+    Requires ``numpy`` to be installed.
+    """
+    # numpy is optional dependency, imported only when needed
+    import numpy as np  # noqa: PLC0415
+
+    indexes = _year_month_indexes(
+        start, end, include_start=include_start, include_end=include_end
+    )
+
+    # datetime64[M] counts months from 1970-01
+    return np.arange(
+        indexes.start - _EPOCH_YEAR_MONTH_INDEX,
+        max(indexes.start, indexes.stop) - _EPOCH_YEAR_MONTH_INDEX,
+        dtype="int64",
+    ).view("datetime64[M]")
@@ -41,20 +41,53 @@ class ExceptionsAsErrors:
         return True
 
 
+_SEQUENCE_TYPES = (abc.Sequence, abc.Set)
+_SELF_ERRORS_KEY = "_schema"
+
+
 def _normalize_error_data(error):
-    if isinstance(error, str):
-        return error
+    """
+    Converts ``error`` into tree of `dict`, `list` and `str` objects.
+
+    Tree is traversed with explicit stack instead of recursion so that deeply nested
+    error structures don't pay for Python call frame per node (and can't hit the
+    recursion limit).
+    """
+    root = [None]
+    stack = [(root, 0, error)]
+
+    while stack:
+        parent, key, node = stack.pop()
+
+        if isinstance(node, str):
+            parent[key] = node
+
+        elif isinstance(node, _SEQUENCE_TYPES):
+            children = list(node)
+            normalized = [None] * len(children)
+            parent[key] = normalized
+            stack.extend((normalized, idx, child) for idx, child in enumerate(children))
 
-    if isinstance(error, abc.Sequence | abc.Set):
-        return [_normalize_error_data(obj) for obj in error]
+        elif isinstance(node, abc.Mapping):
+            normalized = dict.fromkeys(node)
+            parent[key] = normalized
+            stack.extend((normalized, k, v) for k, v in node.items())
 
-    if isinstance(error, abc.Mapping):
-        return {k: _normalize_error_data(v) for k, v in error.items()}
+        elif hasattr(node, "normalized_messages"):
+            stack.append((parent, key, node.normalized_messages()))
 
-    if hasattr(error, "normalized_messages"):
-        return _normalize_error_data(error.normalized_messages())
+        else:
+            parent[key] = str(node)
 
-    return str(error)
+    return root[0]
+
+
+def _self_errors(dest: Mapping) -> list:
+    """Returns list of ``dest``'s own errors, creating it if needed."""
+    errors = dest.get(_SELF_ERRORS_KEY)
+    if not errors:
+        errors = dest[_SELF_ERRORS_KEY] = []
+    return errors
 
 
 def add_error_to(  # noqa: C901, PLR0912, PLR0915
@@ -150,8 +183,6 @@ def add_error_to(  # noqa: C901, PLR0912, PLR0915
             object we expect it to have attribute ``errors`` and that these are a dict.
             If no such attribute exists on given object, we will attach our own.
     """
-    _SELF_ERRORS_KEY = "_schema"
-
     dest = None
     if errors_store is None:
         raise RuntimeError(
@@ -164,68 +195,81 @@ def add_error_to(  # noqa: C901, PLR0912, PLR0915
         errors_store.errors = getval(errors_store, "errors", {})
         dest = errors_store.errors
 
+    # Fast paths for the most common cases, nothing to normalize in them
+    if type(error) is str:
+        if error and not error.isspace():
+            _self_errors(dest).append(error)
+        return dest
+
+    if type(error) is list and all(type(_) is str for _ in error):
+        if not is_blank(error):
+            _self_errors(dest).extend(error)
+        return dest
+
     data = _normalize_error_data(error)
 
     if is_blank(data):
         return dest
 
     if isinstance(data, str):
-        dest[_SELF_ERRORS_KEY] = getval(dest, _SELF_ERRORS_KEY, [])
-        dest[_SELF_ERRORS_KEY].append(data)
+        _self_errors(dest).append(data)
         return dest
 
     if isinstance(data, list):
-        dest[_SELF_ERRORS_KEY] = getval(dest, _SELF_ERRORS_KEY, [])
-        dest[_SELF_ERRORS_KEY].extend(data)
+        _self_errors(dest).extend(data)
         return dest
 
-    for k, v in data.items():
-        if is_blank(v):
-            continue
+    # Nested dicts are merged level by level from explicit stack of
+    # (destination dict, normalized source dict) pairs instead of recursing.
+    stack = [(dest, data)]
+    while stack:
+        dst, src = stack.pop()
 
-        if k in dest:
-            if isinstance(dest[k], list):
-                if isinstance(v, str):
-                    dest[k].append(v)
+        for k, v in src.items():
+            if is_blank(v):
+                continue
 
-                elif isinstance(v, list):
-                    dest[k].extend(v)
+            if k in dst:
+                existing = dst[k]
+                if isinstance(existing, list):
+                    if isinstance(v, str):
+                        existing.append(v)
 
-                elif isinstance(v, dict):
-                    dest[k] = {_SELF_ERRORS_KEY: dest[k]}
-                    add_error_to(dest[k], v)
+                    elif isinstance(v, list):
+                        existing.extend(v)
 
-                else:
-                    dest[k].append(str(v))
+                    elif isinstance(v, dict):
+                        dst[k] = {_SELF_ERRORS_KEY: existing}
+                        stack.append((dst[k], v))
+
+                    else:
+                        existing.append(str(v))
+
+                else:  # noqa: PLR5501
+                    if isinstance(v, str):
+                        _self_errors(existing).append(v)
+
+                    elif isinstance(v, list):
+                        _self_errors(existing).extend(v)
+
+                    elif isinstance(v, dict):
+                        stack.append((existing, v))
+
+                    else:
+                        _self_errors(existing).append(str(v))
 
             else:  # noqa: PLR5501
                 if isinstance(v, str):
-                    dest[k][_SELF_ERRORS_KEY] = getval(dest[k], _SELF_ERRORS_KEY, [])
-                    dest[k][_SELF_ERRORS_KEY].append(v)
+                    dst[k] = [v]
 
                 elif isinstance(v, list):
-                    dest[k][_SELF_ERRORS_KEY] = getval(dest[k], _SELF_ERRORS_KEY, [])
-                    dest[k][_SELF_ERRORS_KEY].extend(v)
+                    dst[k] = v
 
                 elif isinstance(v, dict):
-                    add_error_to(dest[k], v)
+                    dst[k] = {}
+                    stack.append((dst[k], v))
 
                 else:
-                    dest[k][_SELF_ERRORS_KEY] = getval(dest[k], _SELF_ERRORS_KEY, [])
-                    dest[k][_SELF_ERRORS_KEY].append(str(v))
-
-        else:  # noqa: PLR5501
-            if isinstance(v, str):
-                dest[k] = [v]
-
-            elif isinstance(v, list):
-                dest[k] = v
-
-            elif isinstance(v, dict):
-                dest[k] = {}
-                add_error_to(dest[k], v)
-
-            else:
-                dest[k] = [str(v)]
+                    dst[k] = [str(v)]
 
     return dest
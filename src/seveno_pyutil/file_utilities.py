@@ -1,41 +1,95 @@
 from __future__ import annotations
 
+import errno
+import hashlib
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .string_utilities import is_blank
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-def file_checksum(file_path: str | Path, hashlib_callable):
-    """Given path of the file and hash function, calculates file digest"""
+# Python >= 3.11
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
+
+_CHECKSUM_BLOCK_SIZE = 1 << 20
+_CHECKSUM_OPEN_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_NONBLOCK", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def file_checksum(
+    file_path: str | Path, hashlib_callable, *, chunk_size: int | None = None
+):
+    """
+    Given path of the file and hash function, calculates file digest
+
+    File is read in 1 MiB chunks (or via `hashlib.file_digest` where available).
+    ``chunk_size`` can be used to tune read size for particular storage, in which
+    case file is always read by our own loop.
+    """
+
+    if not callable(hashlib_callable):
+        return None
+
+    # Open first and check what was opened with fstat(), instead of stat-ing path with
+    # Path.is_file() and then opening it. O_NONBLOCK so that opening FIFO doesn't wait
+    # for writer; only regular files are hashed (no FIFOs, /dev/zero, ...).
+    try:
+        fd = os.open(file_path, _CHECKSUM_OPEN_FLAGS)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+    if not stat.S_ISREG(os.fstat(fd).st_mode):
+        os.close(fd)
+        return None
+
+    # Unbuffered because we read in large blocks anyway
+    with os.fdopen(fd, "rb", buffering=0) as f:
+        if _HAS_FILE_DIGEST and chunk_size is None:
+            return hashlib.file_digest(f, hashlib_callable).hexdigest()
 
-    if Path(file_path).is_file() and callable(hashlib_callable):
         hash_obj = hashlib_callable()
-        with Path(file_path).open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
+        buf = bytearray(chunk_size or _CHECKSUM_BLOCK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            hash_obj.update(view[:n])
         return hash_obj.hexdigest()
 
-    return None
-
 
 def abspath_if_relative(relative_path: str | Path, relative_to: str | Path):
     """Creates absolute path from relative, but places it under other path.
 
+    Path is normalized lexically (like `os.path.abspath`), filesystem is not accessed
+    and symlinks are not resolved.
+
     Example:
         >>> abspath_if_relative('foo/bar/baz', relative_to='/tmp')
-        '/tmp/foo/bar/baz'
+        PosixPath('/tmp/foo/bar/baz')
     """
-    retv = relative_path
+    if is_blank(relative_path):
+        return relative_path
+
+    if is_blank(relative_to):
+        return Path(os.path.abspath(relative_path))  # noqa: PTH100
 
-    if not is_blank(relative_path):
-        if not is_blank(relative_to):
-            if not Path(relative_path).is_absolute():
-                retv = (Path(relative_to) / Path(relative_path)).resolve().absolute()
-        else:
-            retv = Path(relative_path).resolve().absolute()
+    if os.path.isabs(relative_path):  # noqa: PTH117
+        return relative_path
 
-    return retv
+    joined = os.path.join(relative_to, relative_path)  # noqa: PTH118
+
+    # normpath() gives the same result as abspath() for absolute paths, without
+    # os.getcwd() syscall
+    if os.path.isabs(relative_to):  # noqa: PTH117
+        return Path(os.path.normpath(joined))
+
+    return Path(os.path.abspath(joined))  # noqa: PTH100
 
 
 def move_and_create_dest(src_path: str | Path, dst_dir: str | Path):
@@ -44,7 +98,52 @@ def move_and_create_dest(src_path: str | Path, dst_dir: str | Path):
 
     Expects ``dst_dir`` to be directory and if it doesn't exits, tries to
     create it.
+
+    Returns path of moved file.
+    """
+    src_path = Path(src_path)
+    dst_dir = Path(dst_dir)
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    target = dst_dir / src_path.name
+
+    # Same as shutil.move, refuse to overwrite existing destination
+    if target.exists():
+        raise shutil.Error(f"Destination path '{target}' already exists")
+
+    # Single rename syscall for the common case when both paths are on the same
+    # filesystem. shutil.move does that too, but only after bunch of its own checks.
+    try:
+        src_path.replace(target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src_path, target)
+
+    return target
+
+
+def file_checksums(
+    file_paths: Iterable[str | Path],
+    hashlib_callable,
+    *,
+    max_workers: int | None = None,
+) -> dict[str | Path, str | None]:
     """
-    Path(dst_dir).mkdir(parents=True, exist_ok=True)
-    shutil.move(src_path, dst_dir)
-    return Path(dst_dir) / Path(dst_dir).name
+    Calculates digests of many files at once, returning ``{file_path: digest}``.
+
+    Files are hashed concurrently in thread pool: both file reads and hashing release
+    the GIL, so this overlaps IO and hashing of different files. Single file is
+    hashed directly, without thread pool.
+
+    See `file_checksum` for details about individual files.
+    """
+    file_paths = list(file_paths)
+
+    if len(file_paths) <= 1:
+        return {_: file_checksum(_, hashlib_callable) for _ in file_paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(
+            lambda file_path: file_checksum(file_path, hashlib_callable), file_paths
+        )
+        return dict(zip(file_paths, digests, strict=True))
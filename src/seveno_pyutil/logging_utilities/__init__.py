@@ -1,4 +1,10 @@
 from .pretty_formatter import PrettyFormatter
 from .sql_filter import FlaskSQLStats, SQLFilter
 from .standard_metadata_filter import StandardMetadataFilter
-from .utilities import log_to_console_for, log_to_tmp_file_for, silence_logger
+from .utilities import (
+    install_async_handler,
+    install_buffered_handler,
+    log_to_console_for,
+    log_to_tmp_file_for,
+    silence_logger,
+)
@@ -7,7 +7,7 @@ from colorlog import ColoredFormatter as ColoredFormatterBase
 from pretty_traceback.formatting import exc_to_traceback_str
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
     from colorlog.formatter import LogColors, SecondaryLogColors
 
@@ -111,9 +111,8 @@ class PrettyFormatter(logging.Formatter):
             fmt=fmt, datefmt=datefmt, style=style, validate=validate, defaults=defaults
         )
         self.force_single_line = force_single_line
-        self.colorize = colorize
         self._color_formatter: ColoredFormatter | None = None
-        if self.colorize:
+        if colorize:
             self._color_formatter = ColoredFormatter(
                 fmt=fmt,
                 datefmt=datefmt,
@@ -124,19 +123,32 @@ class PrettyFormatter(logging.Formatter):
                 secondary_log_colors=secondary_log_colors,
                 reset=reset,
                 stream=stream,
-                force_color=self.colorize,
-                no_color=not self.colorize,
+                force_color=colorize,
+                no_color=not colorize,
             )
+        self.colorize = colorize
+
+    @property
+    def colorize(self) -> bool:
+        return self._colorize
+
+    @colorize.setter
+    def colorize(self, value: bool):
+        self._colorize = value
+        # Decided once here instead of for each record. Turning colorize on later has
+        # effect only on tracebacks if formatter wasn't constructed with colorize=True.
+        self._format_record: Callable[[logging.LogRecord], str] = (
+            self._color_formatter.format
+            if value and self._color_formatter
+            else super().format
+        )
 
     def formatException(self, ei) -> str:
         _, exc_value, traceback = ei
         return exc_to_traceback_str(exc_value, traceback, color=self.colorize)
 
     def format(self, record: logging.LogRecord) -> str:
-        if self.colorize and self._color_formatter:
-            retv = self._color_formatter.format(record)
-        else:
-            retv = super().format(record)
+        retv = self._format_record(record)
 
         if self.force_single_line:
             return retv.replace("\n", "\\n")
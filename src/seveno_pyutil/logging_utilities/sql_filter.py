@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import enum
+import functools
 import json
 import logging
 import timeit
@@ -16,7 +17,7 @@ import sqlparse
 
 # from pygments.formatters import TerminalTrueColorFormatter
 from pygments.formatters import Terminal256Formatter
-from pygments.lexers import SqlLexer
+from pygments.lexers import SqlLexer, get_lexer_for_mimetype
 
 HAS_PSYCOPG2 = False
 
@@ -39,6 +40,83 @@ except Exception:
     HAS_FLASK = False
 
 
+@functools.cache
+def _sql_lexer() -> SqlLexer:
+    return SqlLexer()
+
+
+@functools.cache
+def _json_lexer():
+    return get_lexer_for_mimetype("application/json")
+
+
+@functools.cache
+def _terminal_formatter() -> Terminal256Formatter:
+    # Building style table makes this one expensive (~0.5 ms), so we build it once
+    return Terminal256Formatter(style="monokai")
+
+
+_SQL_FORMAT_OPTS = {
+    "reindent": True,
+    "keyword_case": "upper",
+    "truncate_strings": 25,
+    "reindent_aligned": True,
+    "wrap_after": 88,
+}
+_SQL_CACHEABLE_LENGTH = 4096
+
+
+@functools.lru_cache(maxsize=256)
+def _reformat_sql(sql: str, *, multiline: bool) -> str:
+    """
+    Reformats SQL with sqlparse. This is expensive (~ms per statement) and the same
+    statements tend to be logged over and over again, hence the cache.
+    """
+    lines = sqlparse.format(sql, **_SQL_FORMAT_OPTS).splitlines()
+
+    if multiline:
+        sql = "\n".join(_.rstrip() for _ in lines if _.strip()).strip()
+    else:
+        sql = " ".join(_.strip() for _ in lines if _.strip()).strip()
+
+    if sql and not sql.endswith(";"):
+        sql = sql + ";"
+
+    return sql
+
+
+_PARAMS_MAX_LENGTH = 500
+_PARAMS_FLAT_MAX_COUNT = 16
+_PARAMS_CONTAINERS = (str, bytes, dict, list, tuple)
+
+
+def _params_json(parameters, max_length: int) -> str:
+    """
+    JSON of query parameters, cut to at least ``max_length`` characters.
+
+    Parameters can be huge (ie. documents inserted into JSONB columns) and only their
+    beginning ends up in logs, so encoding stops as soon as we have enough of it.
+    Incremental encoding is pure Python though, so few short, flat parameters (the
+    usual case) are still encoded in one go, by C encoder.
+    """
+    values = parameters.values() if isinstance(parameters, dict) else parameters
+    if len(values) <= _PARAMS_FLAT_MAX_COUNT and all(
+        not isinstance(_, _PARAMS_CONTAINERS)
+        or (isinstance(_, str) and len(_) <= max_length)
+        for _ in values
+    ):
+        return json.dumps(parameters, cls=JSONEncoder)
+
+    chunks = []
+    length = 0
+    for chunk in JSONEncoder().iterencode(parameters):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length >= max_length:
+            break
+    return "".join(chunks)
+
+
 class SQLFilter(logging.Filter):
     """
     Filter for SQLAlchemy SQL loggers. Optionally reformats and colorizes queries.
@@ -222,6 +300,11 @@ class ConnectionEnricher:
         statement_duration = self._execution_duration(conn)
         FlaskSQLStats.incr_stats(self.lgr, statement_duration)
 
+        # Compiling SQL (mogrify) is expensive, don't do it for records that would be
+        # discarded anyway
+        if not self.lgr.isEnabledFor(logging.DEBUG):
+            return
+
         compiled = self._compiled_sql(conn, cursor, statement, parameters)
 
         self.lgr.debug(
@@ -337,39 +420,20 @@ class RecordEnricher:
             recorded_query.statement, recorded_query.parameters
         )
 
-    _SQL_FORMAT_OPTS = {
-        "reindent": True,
-        "keyword_case": "upper",
-        "truncate_strings": 25,
-        "reindent_aligned": True,
-        "wrap_after": 88,
-    }
-
     def _maybe_multiline(self, sql: str) -> str:
-        if sql:
-            if self.multiline_queries:
-                sql = "\n".join(
-                    _.rstrip()
-                    for _ in sqlparse.format(sql, **self._SQL_FORMAT_OPTS).splitlines()
-                    if _.strip()
-                ).strip()
-            else:
-                sql = " ".join(
-                    _.strip()
-                    for _ in sqlparse.format(sql, **self._SQL_FORMAT_OPTS).splitlines()
-                    if _.strip()
-                ).strip()
+        if not sql:
+            return ""
 
-            if sql and not sql.endswith(";"):
-                sql = sql + ";"
+        # Huge statements (ie. bulk inserts) are unlikely to repeat and would just
+        # bloat the cache
+        if len(sql) <= _SQL_CACHEABLE_LENGTH:
+            return _reformat_sql(sql, multiline=self.multiline_queries)
 
-        return sql or ""
+        return _reformat_sql.__wrapped__(sql, multiline=self.multiline_queries)
 
     def _maybe_colorized(self, sql: str) -> str:
         if self.colorize_queries and sql:
-            sql = pygments.highlight(
-                sql, SqlLexer(), Terminal256Formatter(style="monokai")
-            ).strip()
+            sql = pygments.highlight(sql, _sql_lexer(), _terminal_formatter()).strip()
 
         return sql or ""
 
@@ -394,16 +458,14 @@ class RecordEnricher:
 
         if parameters:
             params_dict = parameters
-            params = json.dumps(params_dict, cls=JSONEncoder).strip()
+            params = _params_json(params_dict, _PARAMS_MAX_LENGTH)
         else:
             params_dict = {}
             params = ""
 
         if self.colorize_queries and params:
             params = pygments.highlight(
-                params,
-                pygments.lexers.get_lexer_for_mimetype("application/json"),
-                Terminal256Formatter(style="monokai"),
+                params, _json_lexer(), _terminal_formatter()
             ).strip()
 
         # rsyslogd limits to 2048 bytes per message by default
@@ -412,11 +474,11 @@ class RecordEnricher:
         # be fully logged in all contexts and log sinks
         if params and params_dict:
             if self.shorten_logs:
-                sql = f"{sql[:1500]} with params {params[:500]}"
+                sql = f"{sql[:1500]} with params {params[:_PARAMS_MAX_LENGTH]}"
             else:
                 # params should always be shortened because they can be huge in when
                 # for exmple we are inserting into PostgreSQL JSONB columns
-                sql = f"{sql} with params {params[:500]}"
+                sql = f"{sql} with params {params[:_PARAMS_MAX_LENGTH]}"
         else:
             sql = (sql or " SQL")[:1300]
 
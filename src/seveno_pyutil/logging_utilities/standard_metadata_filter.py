@@ -1,9 +1,30 @@
+import functools
 import logging
 import socket
-from datetime import datetime
-from zoneinfo import ZoneInfo
+import time
 
-import tzlocal
+_ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _format_utc_offset(seconds: int) -> str:
+    """Formats UTC offset same as `datetime.datetime.isoformat` does."""
+    sign = "-" if seconds < 0 else "+"
+    minutes, seconds = divmod(abs(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if seconds:
+        return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{sign}{hours:02d}:{minutes:02d}"
+
+
+def _resolve_hostname() -> str:
+    try:
+        return socket.gethostname()
+    except Exception:
+        return "-"
+
+
+# Resolved on first use instead of on import
+_cached_hostname = functools.cache(_resolve_hostname)
 
 
 class StandardMetadataFilter(logging.Filter):
@@ -20,22 +41,58 @@ class StandardMetadataFilter(logging.Filter):
     | %(isotime_utc)s   | local time converted to UTC and represented  |
     |                   | as ISO8601 string                            |
     +-------------------+----------------------------------------------+
+
+    Hostname is resolved only once, when first record is filtered. For long running
+    processes whose hostname can change, ``hostname_ttl`` (in seconds) makes filter
+    re-resolve it at most once per that many seconds. It is never resolved per
+    record.
     """
 
-    try:
-        _HOSTNAME = socket.gethostname()
-    except Exception:
-        _HOSTNAME = "-"
+    # (whole second, isotime prefix, UTC offset suffix, isotime_utc prefix) for the
+    # most recently seen second. Kept in single tuple so that concurrent filter() calls
+    # always see consistent data.
+    _last_second: tuple[int, str, str, str] = (-1, "", "", "")
+
+    def __init__(self, name: str = "", *, hostname_ttl: float | None = None):
+        super().__init__(name)
+        self.hostname_ttl = hostname_ttl
+        self._hostname: tuple[float, str] | None = None
 
-    _LOCAL_TZ = ZoneInfo(tzlocal.get_localzone_name())
+    def _current_hostname(self) -> str:
+        if self.hostname_ttl is None:
+            return _cached_hostname()
+
+        cached = self._hostname
+        now = time.monotonic()
+        if cached is None or now - cached[0] > self.hostname_ttl:
+            cached = (now, _resolve_hostname())
+            self._hostname = cached
+
+        return cached[1]
 
     def filter(self, record):
-        dt = datetime.fromtimestamp(record.created).replace(  # noqa: DTZ006
-            tzinfo=self._LOCAL_TZ
-        )
+        # Same output as datetime.isoformat() but without creating datetime objects
+        seconds = int(record.created)
+        microseconds = round((record.created - seconds) * 1e6)
+        if microseconds >= 1_000_000:  # noqa: PLR2004
+            seconds += 1
+            microseconds -= 1_000_000
+        fraction = f".{microseconds:06d}" if microseconds else ""
+
+        cached = self._last_second
+        if cached[0] != seconds:
+            local = time.localtime(seconds)
+            cached = (
+                seconds,
+                time.strftime(_ISO_DATETIME_FORMAT, local),
+                _format_utc_offset(local.tm_gmtoff),
+                time.strftime(_ISO_DATETIME_FORMAT, time.gmtime(seconds)),
+            )
+            self._last_second = cached
 
-        record.isotime = dt.isoformat()
-        record.isotime_utc = dt.astimezone(ZoneInfo("UTC")).isoformat()
-        record.hostname = self._HOSTNAME
+        _, local_prefix, local_offset, utc_prefix = cached
+        record.isotime = local_prefix + fraction + local_offset
+        record.isotime_utc = utc_prefix + fraction + "+00:00"
+        record.hostname = self._current_hostname()
 
         return super().filter(record)
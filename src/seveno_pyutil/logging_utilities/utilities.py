@@ -1,17 +1,24 @@
+import atexit
 import logging
+import queue
 import sys
-from logging import Logger, NullHandler
+import threading
+import weakref
+from logging import Handler, Logger, NullHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
 
+# Stateless, so single instance can be shared by all silenced loggers
+_NULL_HANDLER = NullHandler()
+
 
 def silence_logger(logger: Logger):
     """
     For given logger, replaces all its handlers with :class:`logging.NullHandler`.
     """
-    while logger.handlers:
-        logger.removeHandler(logger.handlers[0])
-
-    logger.addHandler(NullHandler())
+    # Replace whole list at once instead of removing handlers one by one. Threads that
+    # are just emitting records keep iterating over old list.
+    logger.handlers = [_NULL_HANDLER]
 
 
 def log_to_console_for(logger_name: str):
@@ -40,3 +47,189 @@ def log_to_tmp_file_for(
     handler.setLevel(logging.DEBUG)
     logger.setLevel(logging.DEBUG)
     logger.addHandler(handler)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    :class:`logging.handlers.QueueHandler` that silently drops records when queue is
+    full (instead of reporting each one of them through ``handleError``) and counts
+    them in ``dropped_records``.
+    """
+
+    def __init__(self, records: queue.Queue):
+        super().__init__(records)
+        self.dropped_records = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+
+class _AsyncListener(QueueListener):
+    """
+    :class:`logging.handlers.QueueListener` that owns ``queue_handler`` feeding it
+    from ``logger``. ``stop()`` detaches ``queue_handler`` from ``logger``, can safely
+    be called more than once and also works when queue is full. Running listeners
+    are stopped on interpreter exit.
+    """
+
+    def __init__(
+        self,
+        records: queue.Queue,
+        target_handler: Handler,
+        *,
+        logger: Logger,
+        queue_handler: _DroppingQueueHandler,
+    ):
+        super().__init__(records, target_handler, respect_handler_level=True)
+        self.logger = logger
+        self.queue_handler = queue_handler
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        with self._lock:
+            if not self._running:
+                super().start()
+                self._running = True
+                _ASYNC_LISTENERS.add(self)
+                self.logger.addHandler(self.queue_handler)
+
+    def enqueue_sentinel(self):
+        # Stock implementation uses put_nowait() which fails if bounded queue is full.
+        # Listener thread is draining the queue, so blocking here is fine.
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        with self._lock:
+            if self._running:
+                # Detach first, so that nothing is queued after listener is gone
+                self.logger.removeHandler(self.queue_handler)
+                super().stop()
+                self._running = False
+                _ASYNC_LISTENERS.discard(self)
+
+
+# Running listeners are kept alive by their own threads, so weak references are enough
+# and stopped ones don't stick around until interpreter exit.
+_ASYNC_LISTENERS: weakref.WeakSet[_AsyncListener] = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_async_listeners():
+    for listener in list(_ASYNC_LISTENERS):
+        listener.stop()
+
+
+def install_async_handler(
+    logger: str | Logger, target_handler: Handler, queue_size: int = 10_000
+) -> QueueListener:
+    """
+    Attaches ``target_handler`` to ``logger`` so that it runs in background thread.
+
+    Logger gets :class:`logging.handlers.QueueHandler` and ``target_handler`` is driven
+    by :class:`logging.handlers.QueueListener`. Logging call then only puts record into
+    queue and blocking IO (writing to file, socket, syslog, ...) is done off the
+    calling thread. Records that don't fit into full queue are silently dropped
+    instead of blocking caller; their count is kept in
+    ``listener.queue_handler.dropped_records``.
+
+    Listener is stopped (and remaining records are written) on interpreter exit.
+    Returned listener can be used to stop it sooner: ``listener.stop()`` also removes
+    queue handler from ``logger``, so records logged after that are not queued (and
+    not written by ``target_handler``).
+
+    Example:
+        >>> import logging
+        >>>
+        >>> listener = install_async_handler("my_app", logging.StreamHandler())
+        >>> logging.getLogger("my_app").warning("Written from background thread")
+        >>> listener.stop()
+    """
+    if isinstance(logger, str):
+        logger = logging.getLogger(logger)
+
+    records = queue.Queue(maxsize=queue_size)
+    listener = _AsyncListener(
+        records,
+        target_handler,
+        logger=logger,
+        queue_handler=_DroppingQueueHandler(records),
+    )
+    listener.start()
+
+    return listener
+
+
+class _PeriodicallyFlushedMemoryHandler(MemoryHandler):
+    """
+    :class:`logging.handlers.MemoryHandler` that also flushes buffer every
+    ``flush_interval`` seconds, so that records don't get stuck in it when logging is
+    idle.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        flush_level: int,
+        target: Handler,
+        flush_interval: float,
+    ):
+        super().__init__(
+            capacity, flushLevel=flush_level, target=target, flushOnClose=True
+        )
+        # Not named _closed, logging.Handler.close() uses that one for its own flag
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name=f"{type(self).__name__}-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self, flush_interval: float):
+        while not self._stop_flushing.wait(flush_interval):
+            self.flush()
+
+    def close(self):
+        if self._stop_flushing.is_set():
+            return
+        self._stop_flushing.set()
+        super().close()
+
+
+def install_buffered_handler(
+    logger: str | Logger,
+    target_handler: Handler,
+    capacity: int = 512,
+    flush_level: int = logging.ERROR,
+    *,
+    flush_interval: float = 0.5,
+) -> MemoryHandler:
+    """
+    Attaches ``target_handler`` to ``logger`` through buffer that hands records to it
+    in batches.
+
+    Buffer (:class:`logging.handlers.MemoryHandler`) is flushed when it collects
+    ``capacity`` records, when record of ``flush_level`` or higher is logged, every
+    ``flush_interval`` seconds and on interpreter exit.
+
+    Example:
+        >>> import logging
+        >>>
+        >>> handler = install_buffered_handler("my_app", logging.StreamHandler())
+        >>> logging.getLogger("my_app").warning("Written in batch")
+        >>> handler.flush()
+    """
+    if isinstance(logger, str):
+        logger = logging.getLogger(logger)
+
+    handler = _PeriodicallyFlushedMemoryHandler(
+        capacity, flush_level, target_handler, flush_interval
+    )
+    logger.addHandler(handler)
+
+    return handler
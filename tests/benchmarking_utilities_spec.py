@@ -9,3 +9,11 @@ class DescribeStopwatch:
             time.sleep(1)
 
         assert stopwatch.duration_ms >= 1000
+
+    def it_provides_integer_duration_in_nanoseconds(self):
+        with Stopwatch() as stopwatch:
+            time.sleep(0.01)
+
+        assert isinstance(stopwatch.duration_ns, int)
+        assert stopwatch.duration_ns >= 10_000_000
+        assert stopwatch.duration_ms == stopwatch.duration_ns / 1_000_000
@@ -1,4 +1,6 @@
-from seveno_pyutil import in_batches
+import pytest
+
+from seveno_pyutil import in_batches, in_batches_list, inverted
 
 
 class DescribeInBatches:
@@ -27,3 +29,45 @@ class DescribeInBatches:
             result.append([next(batch), next(batch)])
 
         assert result == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+
+
+class DescribeInBatchesList:
+    def it_iterates_iterator_in_batches(self):
+        g = (o for o in range(10))
+        assert list(in_batches_list(g, of_size=3)) == [
+            [0, 1, 2],
+            [3, 4, 5],
+            [6, 7, 8],
+            [9],
+        ]
+
+    def it_iterates_sequence_in_slices(self):
+        assert list(in_batches_list(list(range(10)), of_size=3)) == [
+            [0, 1, 2],
+            [3, 4, 5],
+            [6, 7, 8],
+            [9],
+        ]
+        assert list(in_batches_list("abcdefg", of_size=3)) == ["abc", "def", "g"]
+        assert list(in_batches_list((), of_size=3)) == []
+
+    def it_yields_independent_batches(self):
+        batches = in_batches_list(o for o in range(5))
+        first = next(batches)
+        second = next(batches)
+        assert first == [0]
+        assert second == [1]
+
+    @pytest.mark.parametrize("of_size", [0, -1])
+    def it_rejects_batch_size_less_than_one(self, of_size):
+        with pytest.raises(ValueError, match="Batch size"):
+            in_batches_list([1, 2, 3], of_size=of_size)
+
+        with pytest.raises(ValueError, match="Batch size"):
+            in_batches_list((o for o in range(3)), of_size=of_size)
+
+
+class DescribeInverted:
+    def it_swaps_keys_and_values(self):
+        assert inverted({"a": 1, "b": 2}) == {1: "a", 2: "b"}
+        assert inverted({}) == {}
@@ -1,8 +1,16 @@
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
+import holidays
+import pytest
+
 from seveno_pyutil import ensure_tzinfo
-from seveno_pyutil.datetime_utilities import iter_year_month
+from seveno_pyutil.datetime_utilities import (
+    iter_year_month,
+    iter_year_month_numpy,
+    next_working_day,
+    timezone_or_offset,
+)
 
 
 class describe_ensure_tzinfo:
@@ -57,6 +65,81 @@ class describe_ensure_tzinfo:
             is not None
         )
 
+    def it_returns_same_object_when_datetime_is_already_in_requested_timezone(self):
+        dt = datetime.now(tz=ZoneInfo("UTC"))
+        assert ensure_tzinfo(dt) is dt
+        assert ensure_tzinfo(dt, tz_or_offset="UTC") is dt
+
+        tz = timezone_or_offset("+02:00")
+        dt = datetime.now(tz=tz)
+        assert ensure_tzinfo(dt, tz_or_offset=tz) is dt
+
+    def it_doesnt_treat_naive_datetime_as_already_converted(self):
+        dt = datetime.now()  # noqa: DTZ005
+        assert ensure_tzinfo(dt, tz_or_offset=None).tzinfo is ZoneInfo("UTC")
+
+    def it_applies_offset_sign_to_both_hours_and_minutes(self):
+        dt = datetime(2023, 1, 1, 12, 0)  # noqa: DTZ001
+        for offset in ["-02:30", "-0230"]:
+            assert ensure_tzinfo(dt, offset).utcoffset() == -timedelta(
+                hours=2, minutes=30
+            )
+        for offset in ["+02:30", "02:30", "0230"]:
+            assert ensure_tzinfo(dt, offset).utcoffset() == timedelta(
+                hours=2, minutes=30
+            )
+
+
+class describe_timezone_or_offset:
+    def it_returns_same_object_for_repeated_inputs(self):
+        for from_ in ["Europe/Zagreb", "+02:00", "Z", 3600, timedelta(hours=1)]:
+            assert timezone_or_offset(from_) is timezone_or_offset(from_)
+
+    def it_returns_utc_for_empty_inputs(self):
+        for from_ in [None, "", "Z"]:
+            assert timezone_or_offset(from_) is ZoneInfo("UTC")
+
+
+class describe_next_working_day:
+    def it_skips_weekends_and_holidays(self):
+        assert next_working_day(date(2023, 12, 20)) == date(2023, 12, 21)
+        assert next_working_day(date(2023, 12, 22)) == date(2023, 12, 27)
+        assert next_working_day(date(2024, 4, 30)) == date(2024, 5, 2)
+
+    def it_crosses_year_boundary(self):
+        assert next_working_day(date(2023, 12, 29)) == date(2024, 1, 2)
+
+    def it_uses_given_holidays_calendar(self):
+        assert next_working_day(date(2023, 7, 3), holidays.US()) == date(2023, 7, 5)
+        assert next_working_day(date(2023, 7, 3), holidays.HR()) == date(2023, 7, 4)
+
+    def it_sees_holidays_added_to_already_used_calendar(self):
+        calendar = holidays.HR()
+        assert next_working_day(date(2024, 3, 4), calendar) == date(2024, 3, 5)
+
+        calendar.append({date(2024, 3, 5): "custom"})
+        assert next_working_day(date(2024, 3, 4), calendar) == date(2024, 3, 6)
+
+        calendar.pop(date(2024, 3, 5))
+        assert next_working_day(date(2024, 3, 4), calendar) == date(2024, 3, 5)
+
+    def it_accepts_plain_sets_of_dates(self):
+        days_off = {date(2024, 3, 5)}
+        assert next_working_day(date(2024, 3, 4), days_off) == date(2024, 3, 6)
+
+        days_off.add(date(2024, 3, 6))
+        assert next_working_day(date(2024, 3, 4), days_off) == date(2024, 3, 7)
+
+        days_off.discard(date(2024, 3, 5))
+        assert next_working_day(date(2024, 3, 4), days_off) == date(2024, 3, 5)
+
+    def it_accepts_containers_that_only_implement_contains(self):
+        class DaysOff:
+            def __contains__(self, day):
+                return day == date(2024, 3, 5)
+
+        assert next_working_day(date(2024, 3, 4), DaysOff()) == date(2024, 3, 6)
+
 
 class describe_iter_year_month:
     def it_generates_empty_range_when_start_is_after_end(self):
@@ -134,3 +217,27 @@ class describe_iter_year_month:
             date(2023, 2, 1),
             date(2023, 3, 1),
         ]
+
+
+class describe_iter_year_month_numpy:
+    def it_generates_same_range_as_iter_year_month(self):
+        pytest.importorskip("numpy")
+
+        start = date(2022, 9, 15)
+        end = date(2023, 3, 31)
+        for include_start, include_end in [
+            (False, False),
+            (True, False),
+            (False, True),
+            (True, True),
+        ]:
+            kwargs = {"include_start": include_start, "include_end": include_end}
+            assert [
+                _.astype(object) for _ in iter_year_month_numpy(start, end, **kwargs)
+            ] == list(iter_year_month(start, end, **kwargs))
+            assert [
+                _.astype(object) for _ in iter_year_month_numpy(end, start, **kwargs)
+            ] == []
+            assert [
+                _.astype(object) for _ in iter_year_month_numpy(start, start, **kwargs)
+            ] == list(iter_year_month(start, start, **kwargs))
@@ -1,3 +1,5 @@
+import sys
+
 from seveno_pyutil.error_utilities import ExceptionsAsErrors, add_error_to
 
 
@@ -87,3 +89,32 @@ class DescribeExceptionsAsErrors:
         errors = {"foo": ["is not bar"]}
         add_error_to(errors, {"foo": {"bar": {"baz": "ZOMG"}}})
         assert errors == {"foo": {"_schema": ["is not bar"], "bar": {"baz": ["ZOMG"]}}}
+
+    def it_handles_nesting_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 100
+        error = "ZOMG"
+        for _ in range(depth):
+            error = {"foo": error}
+
+        errors = add_error_to({}, error)
+
+        for _ in range(depth):
+            errors = errors["foo"]
+        assert errors == ["ZOMG"]
+
+    def it_attaches_errors_to_objects(self):
+        class Foo:
+            pass
+
+        foo = Foo()
+        add_error_to(foo, {"bar": ["is not baz"]})
+        add_error_to(foo, "is not foo")
+        assert foo.errors == {"bar": ["is not baz"], "_schema": ["is not foo"]}
+
+    def it_adds_plain_messages_to_self_errors(self):
+        errors = {}
+        add_error_to(errors, "foo")
+        add_error_to(errors, "   ")
+        add_error_to(errors, ["bar", "baz"])
+        add_error_to(errors, ["", " "])
+        assert errors == {"_schema": ["foo", "bar", "baz"]}
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from seveno_pyutil import (
+    abspath_if_relative,
+    file_checksum,
+    file_checksums,
+    move_and_create_dest,
+)
+
+
+class DescribeFileChecksum:
+    def it_calculates_file_digest(self, tmp_path):
+        data = b"seveno_pyutil" * 100_000
+        file_path = tmp_path / "foo.bin"
+        file_path.write_bytes(data)
+
+        assert (
+            file_checksum(file_path, hashlib.blake2b)
+            == hashlib.blake2b(data).hexdigest()
+        )
+        assert (
+            file_checksum(str(file_path), hashlib.sha256)
+            == hashlib.sha256(data).hexdigest()
+        )
+
+    def it_reads_file_in_chunks_of_given_size(self, tmp_path):
+        data = b"seveno_pyutil" * 100_000
+        file_path = tmp_path / "foo.bin"
+        file_path.write_bytes(data)
+
+        for chunk_size in [4093, 1 << 20, 1 << 22]:
+            assert (
+                file_checksum(file_path, hashlib.sha256, chunk_size=chunk_size)
+                == hashlib.sha256(data).hexdigest()
+            )
+
+    def it_returns_none_for_missing_file(self, tmp_path):
+        assert file_checksum(tmp_path / "missing.bin", hashlib.blake2b) is None
+        assert file_checksum(tmp_path, hashlib.blake2b) is None
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def it_returns_none_for_fifo_without_blocking(self, tmp_path):
+        fifo = tmp_path / "fifo"
+        os.mkfifo(fifo)
+
+        assert file_checksum(fifo, hashlib.blake2b) is None
+        assert file_checksums([fifo, fifo], hashlib.blake2b) == {fifo: None}
+
+    @pytest.mark.skipif(not Path("/dev/null").exists(), reason="requires /dev/null")
+    def it_returns_none_for_devices(self):
+        assert file_checksum("/dev/null", hashlib.blake2b) is None
+        assert file_checksum("/dev/zero", hashlib.blake2b) is None
+
+
+class DescribeFileChecksums:
+    def it_calculates_digests_of_many_files(self, tmp_path):
+        expected = {}
+        for idx in range(10):
+            file_path = tmp_path / f"{idx}.bin"
+            data = str(idx).encode() * 100_000
+            file_path.write_bytes(data)
+            expected[file_path] = hashlib.sha256(data).hexdigest()
+        expected[tmp_path / "missing.bin"] = None
+
+        assert file_checksums(expected.keys(), hashlib.sha256) == expected
+        first = next(iter(expected))
+        assert file_checksums([first], hashlib.sha256) == {first: expected[first]}
+        assert file_checksums([], hashlib.sha256) == {}
+
+
+class DescribeMoveAndCreateDest:
+    def it_moves_file_into_created_directory(self, tmp_path):
+        src = tmp_path / "foo.txt"
+        src.write_text("foo")
+        dst_dir = tmp_path / "bar" / "baz"
+
+        retv = move_and_create_dest(src, dst_dir)
+
+        assert retv == dst_dir / "foo.txt"
+        assert retv.read_text() == "foo"
+        assert not src.exists()
+
+    def it_refuses_to_overwrite_existing_file(self, tmp_path):
+        src = tmp_path / "foo.txt"
+        src.write_text("foo")
+        dst_dir = tmp_path / "bar"
+        dst_dir.mkdir()
+        (dst_dir / "foo.txt").write_text("bar")
+
+        with pytest.raises(shutil.Error):
+            move_and_create_dest(src, dst_dir)
+
+        assert src.read_text() == "foo"
+        assert (dst_dir / "foo.txt").read_text() == "bar"
+
+
+class DescribeAbspathIfRelative:
+    def it_places_relative_path_under_other_path(self, tmp_path):
+        assert abspath_if_relative("foo/bar", relative_to=tmp_path) == (
+            tmp_path / "foo" / "bar"
+        )
+        assert abspath_if_relative("/foo/bar", relative_to=tmp_path) == "/foo/bar"
+        assert abspath_if_relative("", relative_to=tmp_path) == ""
+
+    def it_normalizes_joined_path(self, tmp_path, monkeypatch):
+        assert abspath_if_relative("foo/../bar/./baz", relative_to=tmp_path) == (
+            tmp_path / "bar" / "baz"
+        )
+
+        monkeypatch.chdir(tmp_path)
+        assert abspath_if_relative("bar", relative_to="foo/..") == tmp_path / "bar"
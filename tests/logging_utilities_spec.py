@@ -0,0 +1,310 @@
+import json
+import logging
+import logging.handlers
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from seveno_pyutil import (
+    PrettyFormatter,
+    SQLFilter,
+    StandardMetadataFilter,
+    install_async_handler,
+    install_buffered_handler,
+    silence_logger,
+)
+from seveno_pyutil.logging_utilities.sql_filter import SQLRecordedQuery
+
+
+def _record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord("foo", logging.INFO, __file__, 42, "bar", None, None)
+    record.created = created
+    return record
+
+
+class DescribeStandardMetadataFilter:
+    def it_adds_iso_timestamps_and_hostname(self):
+        for created in [1_693_994_096.123456, 1_693_994_096.0, 0.5]:
+            record = _record(created)
+
+            assert StandardMetadataFilter().filter(record)
+
+            dt = datetime.fromtimestamp(created).astimezone()
+            assert record.isotime == dt.isoformat()
+            assert record.isotime_utc == dt.astimezone(timezone.utc).isoformat()
+            assert record.hostname
+
+    def it_reuses_formatted_second_for_records_from_same_second(self):
+        metadata_filter = StandardMetadataFilter()
+
+        for created in [1_693_994_096.5, 1_693_994_096.25, 1_693_994_097.0]:
+            record = _record(created)
+            metadata_filter.filter(record)
+
+            dt = datetime.fromtimestamp(created).astimezone()
+            assert record.isotime == dt.isoformat()
+            assert record.isotime_utc == dt.astimezone(timezone.utc).isoformat()
+
+    def it_can_periodically_refresh_hostname(self, monkeypatch):
+        metadata_filter = StandardMetadataFilter(hostname_ttl=60)
+        old_host = socket.gethostname()
+
+        metadata_filter.filter(record := _record(1_693_994_096.5))
+        assert record.hostname == old_host
+
+        monkeypatch.setattr(socket, "gethostname", lambda: "new-host")
+        metadata_filter.filter(record := _record(1_693_994_096.5))
+        assert record.hostname == old_host
+
+        monotonic = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: monotonic + 61)
+        metadata_filter.filter(record := _record(1_693_994_096.5))
+        assert record.hostname == "new-host"
+
+
+def _sql_record(**kwargs) -> logging.LogRecord:
+    record = _record(1_693_994_096.5)
+    record._sql = SQLRecordedQuery(duration=timedelta(milliseconds=1.5), **kwargs)
+    return record
+
+
+class DescribeSQLFilter:
+    def it_adds_empty_placeholders_to_non_sql_records(self):
+        record = _record(1_693_994_096.5)
+
+        assert SQLFilter().filter(record)
+
+        assert record.sql == ""
+        assert record.sql_duration == ""
+
+    def it_formats_statement_with_params(self):
+        record = _sql_record(
+            statement="select id, name from foos where id = %(id)s",
+            parameters={"id": 42},
+        )
+
+        SQLFilter().filter(record)
+
+        assert (
+            record.sql
+            == 'SELECT id, name FROM foos WHERE id = %(id)s; with params {"id": 42}'
+        )
+        assert record.sql_duration == "1.50 ms"
+
+    def it_prefers_compiled_statement(self):
+        record = _sql_record(
+            statement="select id from foos where id = %(id)s",
+            parameters={"id": 42},
+            compiled="select id from foos where id = 42",
+        )
+
+        SQLFilter().filter(record)
+
+        assert record.sql == "SELECT id FROM foos WHERE id = 42;"
+
+    def it_can_format_multiline_queries(self):
+        record = _sql_record(
+            statement="select id, name from foos where id = 42", parameters={}
+        )
+
+        SQLFilter(multiline_queries=True).filter(record)
+
+        assert record.sql == "SELECT id,\n       name\n  FROM foos\n WHERE id = 42;"
+
+    def it_can_colorize_queries(self):
+        record = _sql_record(
+            statement="select id from foos where id = %(id)s", parameters={"id": 42}
+        )
+
+        SQLFilter(colorize_queries=True).filter(record)
+
+        assert "\x1b[" in record.sql
+        assert "with params" in record.sql
+
+    def it_logs_only_beginning_of_huge_params(self):
+        document = {f"key_{i}": "value" * 10 for i in range(10_000)}
+        record = _sql_record(
+            statement="insert into foos (doc) values (%(doc)s)",
+            parameters={"doc": document},
+        )
+
+        SQLFilter().filter(record)
+
+        _, params = record.sql.split(" with params ")
+        assert len(params) == 500
+        assert params == json.dumps({"doc": document})[:500]
+
+
+class DescribeInstallAsyncHandler:
+    def it_handles_records_in_background_thread(self):
+        handled = []
+
+        class RecordingHandler(logging.Handler):
+            def emit(self, record):
+                handled.append((record.getMessage(), threading.current_thread()))
+
+        logger = logging.getLogger("seveno_pyutil.tests.async")
+        listener = install_async_handler(logger, RecordingHandler())
+        try:
+            logger.warning("foo")
+        finally:
+            listener.stop()
+            logger.handlers.clear()
+
+        assert len(handled) == 1
+        message, thread = handled[0]
+        assert message == "foo"
+        assert thread is not threading.current_thread()
+
+    def it_silently_drops_records_when_queue_is_full(self, capsys):
+        unblock = threading.Event()
+        handled = []
+
+        class BlockedHandler(logging.Handler):
+            def emit(self, record):
+                unblock.wait(5)
+                handled.append(record.getMessage())
+
+        logger = logging.getLogger("seveno_pyutil.tests.async")
+        listener = install_async_handler(logger, BlockedHandler(), queue_size=1)
+        try:
+            for i in range(10):
+                logger.warning("foo %d", i)
+            queue_handler = listener.queue_handler
+        finally:
+            unblock.set()
+            listener.stop()
+            logger.handlers.clear()
+
+        assert queue_handler.dropped_records > 0
+        assert len(handled) + queue_handler.dropped_records == 10
+        assert capsys.readouterr().err == ""
+
+    def it_detaches_queue_handler_from_logger_when_stopped(self):
+        handled = []
+
+        class RecordingHandler(logging.Handler):
+            def emit(self, record):
+                handled.append(record.getMessage())
+
+        logger = logging.getLogger("seveno_pyutil.tests.async")
+        listener = install_async_handler(logger, RecordingHandler())
+        try:
+            logger.warning("foo")
+            listener.stop()
+            logger.warning("bar")
+        finally:
+            logger.handlers.clear()
+
+        assert handled == ["foo"]
+        assert listener.queue_handler not in logger.handlers
+        assert listener.queue.empty()
+        assert listener.queue_handler.dropped_records == 0
+
+    def it_can_be_stopped_more_than_once(self):
+        logger = logging.getLogger("seveno_pyutil.tests.async")
+        listener = install_async_handler(logger, logging.NullHandler())
+        try:
+            listener.stop()
+            listener.stop()
+        finally:
+            logger.handlers.clear()
+
+
+class DescribeInstallBufferedHandler:
+    def it_hands_records_to_target_in_batches(self):
+        target = logging.handlers.BufferingHandler(capacity=1000)
+        logger = logging.getLogger("seveno_pyutil.tests.buffered")
+        handler = install_buffered_handler(
+            logger, target, capacity=3, flush_interval=3600
+        )
+        try:
+            logger.warning("foo")
+            logger.warning("bar")
+            assert target.buffer == []
+
+            logger.warning("baz")
+            assert [_.getMessage() for _ in target.buffer] == ["foo", "bar", "baz"]
+
+            logger.error("qux")
+            assert len(target.buffer) == 4
+        finally:
+            handler.close()
+            logger.handlers.clear()
+
+    def it_periodically_flushes_buffer(self):
+        target = logging.handlers.BufferingHandler(capacity=1000)
+        logger = logging.getLogger("seveno_pyutil.tests.buffered")
+        handler = install_buffered_handler(logger, target, flush_interval=0.01)
+        try:
+            logger.warning("foo")
+
+            deadline = time.monotonic() + 5
+            while not target.buffer and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert [_.getMessage() for _ in target.buffer] == ["foo"]
+        finally:
+            handler.close()
+            logger.handlers.clear()
+
+    def it_can_be_closed_more_than_once(self):
+        target = logging.handlers.BufferingHandler(capacity=1000)
+        logger = logging.getLogger("seveno_pyutil.tests.buffered")
+        handler = install_buffered_handler(logger, target, flush_interval=0.01)
+        try:
+            logger.warning("foo")
+            handler.close()
+            time.sleep(0.05)
+            handler.close()
+        finally:
+            logger.handlers.clear()
+
+        assert [_.getMessage() for _ in target.buffer] == ["foo"]
+        assert not handler._flusher.is_alive()
+
+
+class DescribeSilenceLogger:
+    def it_replaces_all_handlers_with_null_handler(self):
+        logger = logging.getLogger("seveno_pyutil.tests.silenced")
+        logger.addHandler(logging.StreamHandler())
+        logger.addHandler(logging.StreamHandler())
+        try:
+            silence_logger(logger)
+
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], logging.NullHandler)
+        finally:
+            logger.handlers.clear()
+
+
+class DescribePrettyFormatter:
+    def it_can_force_single_line_output(self):
+        record = _record(1_693_994_096.5)
+        record.msg = "foo\nbar"
+
+        assert PrettyFormatter("%(message)s").format(record) == "foo\\nbar"
+        assert (
+            PrettyFormatter("%(message)s", force_single_line=False).format(record)
+            == "foo\nbar"
+        )
+
+    def it_can_colorize_output(self):
+        record = _record(1_693_994_096.5)
+
+        formatted = PrettyFormatter(
+            "%(log_color)s%(levelname)s%(reset)s %(message)s", colorize=True
+        ).format(record)
+
+        assert formatted.startswith("\x1b[")
+        assert "INFO\x1b[0m bar" in formatted
+
+    def it_can_turn_colorizing_off_after_construction(self):
+        record = _record(1_693_994_096.5)
+        formatter = PrettyFormatter("%(levelname)s %(message)s", colorize=True)
+        assert formatter.format(record).endswith("\x1b[0m")
+
+        formatter.colorize = False
+
+        assert formatter.format(record) == "INFO bar"
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import seveno_pyutil
+
+
+class DescribePackage:
+    def it_exposes_submodules_as_attributes(self):
+        script = (
+            "import seveno_pyutil; "
+            "seveno_pyutil.datetime_utilities.iter_year_month; "
+            "seveno_pyutil.logging_utilities.SQLFilter; "
+            "seveno_pyutil.file_utilities.file_checksum"
+        )
+
+        # Fresh interpreter, so that no other test has imported submodules yet
+        subprocess.run([sys.executable, "-c", script], check=True)  # noqa: S603
+
+    def it_lists_submodules_and_public_names(self):
+        names = dir(seveno_pyutil)
+
+        assert "datetime_utilities" in names
+        assert "logging_utilities" in names
+        assert "is_blank" in names
+
+    def it_raises_attribute_error_for_unknown_names(self):
+        assert not hasattr(seveno_pyutil, "no_such_thing")